@@ -1,7 +1,8 @@
 import sys
 import os
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import cv2
+import numpy as np
 import toml
 import argparse
 from PySide6.QtWidgets import (
@@ -18,6 +19,7 @@ from PySide6.QtWidgets import (
     QComboBox,
     QCheckBox,
     QApplication,
+    QStyle,
 )
 from PySide6.QtGui import (
     QImage,
@@ -27,9 +29,14 @@ from PySide6.QtGui import (
     QColor,
     QGuiApplication,
 )
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QRect, QThread, Signal
 
 from fly_video_filtering.utils.annotation import save_annotations, load_annotations
+from fly_video_filtering.utils.thumbnails import (
+    ThumbnailIndex,
+    build_thumbnail_index,
+    load_thumbnail_index,
+)
 
 # Predefined colors for automatic assignment
 AUTO_COLORS = [
@@ -50,6 +57,180 @@ AUTO_COLORS = [
 ]
 
 
+class ThumbnailIndexer(QThread):
+    """Builds the thumbnail cache for one video off the GUI thread."""
+
+    progress = Signal(str, int)
+    finished_index = Signal(str, object)
+
+    def __init__(self, video_path: str, parent=None):
+        super().__init__(parent)
+        self.video_path = video_path
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+
+    def run(self):
+        index = build_thumbnail_index(
+            self.video_path,
+            progress_callback=self._report_progress,
+            should_stop=lambda: self._stop_requested,
+        )
+        if not self._stop_requested:
+            self.finished_index.emit(self.video_path, index)
+
+    def _report_progress(self, done: int, total: int):
+        self.progress.emit(self.video_path, int(100 * done / total))
+
+
+class FilmstripWidget(QWidget):
+    """Filmstrip and activity track rendered entirely from a ThumbnailIndex."""
+
+    # Emitted while dragging, for showing the cached thumbnail only
+    frame_previewed = Signal(int)
+    # Emitted once when the mouse is released, for seeking to the frame
+    frame_selected = Signal(int)
+
+    STRIP_HEIGHT = 45
+    ACTIVITY_HEIGHT = 25
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(self.STRIP_HEIGHT + self.ACTIVITY_HEIGHT)
+        self.index: Optional[ThumbnailIndex] = None
+        self.total_frames = 0
+        self.current_frame = 0
+        self.status_text = ""
+        self.margin = 0
+        self._dragging = False
+        self._background: Optional[QPixmap] = None
+
+    def set_index(self, index: Optional[ThumbnailIndex], total_frames: int):
+        self.index = index
+        self.total_frames = total_frames
+        self.status_text = "" if index else "No thumbnail index"
+        self._background = None
+        self.update()
+
+    def set_status(self, text: str):
+        self.status_text = text
+        self.update()
+
+    def set_current_frame(self, frame: int):
+        self.current_frame = frame
+        self.update()
+
+    def set_margin(self, margin: int):
+        """Inset the track by half the slider handle so frames line up with it."""
+        self.margin = margin
+        self._background = None
+        self.update()
+
+    def span(self) -> int:
+        return max(self.width() - 2 * self.margin, 1)
+
+    def frame_at(self, x: float) -> int:
+        # Same mapping as QSlider, so a frame sits directly above its handle
+        return QStyle.sliderValueFromPosition(
+            0, max(self.total_frames - 1, 0), int(x) - self.margin, self.span()
+        )
+
+    def x_for_frame(self, frame: int) -> int:
+        return self.margin + QStyle.sliderPositionFromValue(
+            0, max(self.total_frames - 1, 0), frame, self.span()
+        )
+
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+
+    def mousePressEvent(self, event):
+        if self.index is None or event.button() != Qt.LeftButton:
+            return
+        self._dragging = True
+        self._preview(event.position().x())
+
+    def mouseMoveEvent(self, event):
+        if self._dragging:
+            self._preview(event.position().x())
+
+    def mouseReleaseEvent(self, event):
+        if not self._dragging or event.button() != Qt.LeftButton:
+            return
+        self._dragging = False
+        self.frame_selected.emit(self.frame_at(event.position().x()))
+
+    def _preview(self, x: float):
+        frame = self.frame_at(x)
+        self.set_current_frame(frame)
+        self.frame_previewed.emit(frame)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("black"))
+
+        if self.index is not None:
+            if self._background is None:
+                self._background = self._render_background()
+            painter.drawPixmap(0, 0, self._background)
+
+            pen = QPen(QColor("red"))
+            pen.setWidth(2)
+            painter.setPen(pen)
+            x = self.x_for_frame(self.current_frame)
+            painter.drawLine(x, 0, x, self.height())
+        elif self.status_text:
+            painter.setPen(QColor("white"))
+            painter.drawText(self.rect(), Qt.AlignCenter, self.status_text)
+        painter.end()
+
+    def _render_background(self) -> QPixmap:
+        width, height = self.width(), self.height()
+        span = self.span()
+        pixmap = QPixmap(width, height)
+        pixmap.fill(QColor("black"))
+        painter = QPainter(pixmap)
+        painter.setClipRect(QRect(self.margin, 0, span, height))
+
+        # Filmstrip: tile the track with the thumbnails nearest to each tile
+        thumb_h, thumb_w = self.index.thumbnails.shape[1:3]
+        tile_w = max(1, int(self.STRIP_HEIGHT * thumb_w / thumb_h))
+        n_tiles = max(1, -(-span // tile_w))
+        for i in range(n_tiles):
+            x = self.margin + i * tile_w
+            thumb = np.ascontiguousarray(
+                self.index.thumbnail_for_frame(self.frame_at(x + tile_w / 2))
+            )
+            image = QImage(
+                thumb.data, thumb_w, thumb_h, 3 * thumb_w, QImage.Format_RGB888
+            )
+            painter.drawImage(QRect(x, 0, tile_w, self.STRIP_HEIGHT), image)
+
+        # Activity track: peak score per pixel column, scaled to the clip max
+        activity = self.index.activity
+        n = len(activity)
+        columns = np.zeros(span, dtype=np.float32)
+        for i in range(span):
+            x = self.margin + i
+            start = min(self.frame_at(x), n - 1)
+            end = max(start + 1, min(self.frame_at(x + 1), n))
+            columns[i] = activity[start:end].max()
+        peak = columns.max()
+        if peak > 0:
+            columns /= peak
+
+        painter.setPen(QColor("orange"))
+        baseline = height - 1
+        for i, value in enumerate(columns):
+            bar = int(value * (self.ACTIVITY_HEIGHT - 2))
+            if bar > 0:
+                x = self.margin + i
+                painter.drawLine(x, baseline, x, baseline - bar)
+        painter.end()
+        return pixmap
+
+
 class AnnotationGUI(QMainWindow):
     def __init__(self, video_list: List[str], skeleton_config: Dict):
         super().__init__()
@@ -61,12 +242,13 @@ class AnnotationGUI(QMainWindow):
         self.total_frames = 0
         self.annotations = {}
         self.auto_advance = False
+        self.indexer = None
 
         self.init_ui()
 
     def init_ui(self):
         self.setWindowTitle("Fly Video Annotation")
-        self.setFixedSize(1000, 700)  # Fixed window size
+        self.setFixedSize(1000, 780)  # Fixed window size
 
         main_widget = QWidget()
         main_layout = QHBoxLayout()
@@ -117,6 +299,24 @@ class AnnotationGUI(QMainWindow):
         self.frame_input.setFixedWidth(50)
         self.frame_input.returnPressed.connect(self.jump_to_frame)
         nav_layout.addWidget(self.frame_input)
+
+        # Filmstrip overview, laid out exactly like the slider row below it
+        filmstrip_layout = QHBoxLayout()
+        self.filmstrip = FilmstripWidget()
+        self.filmstrip.set_margin(
+            self.frame_slider.style().pixelMetric(
+                QStyle.PM_SliderLength, None, self.frame_slider
+            )
+            // 2
+        )
+        self.filmstrip.frame_previewed.connect(self.preview_frame)
+        self.filmstrip.frame_selected.connect(self.select_frame)
+        filmstrip_layout.addWidget(self.filmstrip)
+        filmstrip_spacer = QWidget()
+        filmstrip_spacer.setFixedWidth(self.frame_input.width())
+        filmstrip_layout.addWidget(filmstrip_spacer)
+
+        right_layout.addLayout(filmstrip_layout)
         right_layout.addLayout(nav_layout)
 
         right_panel.setLayout(right_layout)
@@ -139,8 +339,52 @@ class AnnotationGUI(QMainWindow):
         self.frame_slider.setValue(0)
         self.annotations = {}
         self.load_existing_annotations()
+        self.load_thumbnail_index()
         self.update_frame()
 
+    def load_thumbnail_index(self):
+        self.stop_indexer()
+        index = load_thumbnail_index(self.current_video)
+        self.filmstrip.set_index(index, self.total_frames)
+        if index is None:
+            self.filmstrip.set_status("Indexing video...")
+            self.indexer = ThumbnailIndexer(self.current_video, self)
+            self.indexer.progress.connect(self.indexing_progress)
+            self.indexer.finished_index.connect(self.indexing_finished)
+            self.indexer.start()
+
+    def stop_indexer(self):
+        if self.indexer is not None:
+            self.indexer.stop()
+            self.indexer.wait()
+            self.indexer = None
+
+    def indexing_progress(self, video_path, percent):
+        if video_path == self.current_video:
+            self.filmstrip.set_status(f"Indexing video... {percent}%")
+
+    def indexing_finished(self, video_path, index):
+        if video_path == self.current_video:
+            self.filmstrip.set_index(index, self.total_frames)
+
+    def preview_frame(self, frame):
+        # Cached thumbnail only; the real frame is decoded on release
+        index = self.filmstrip.index
+        if index is None:
+            return
+        thumb = np.ascontiguousarray(index.thumbnail_for_frame(frame))
+        h, w, ch = thumb.shape
+        image = QImage(thumb.data, w, h, ch * w, QImage.Format_RGB888)
+        self.video_label.setPixmap(QPixmap.fromImage(image).scaled(800, 600))
+        self.frame_input.setText(str(frame))
+
+    def select_frame(self, frame):
+        if frame == self.frame_slider.value():
+            # No valueChanged signal, but the label may still show a preview
+            self.update_frame()
+        else:
+            self.frame_slider.setValue(frame)
+
     def update_frame(self):
         if not self.cap:
             return
@@ -151,6 +395,7 @@ class AnnotationGUI(QMainWindow):
         if ret:
             self.display_frame(frame)
         self.frame_input.setText(str(self.current_frame))
+        self.filmstrip.set_current_frame(self.current_frame)
 
     def display_frame(self, frame):
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
@@ -239,6 +484,10 @@ class AnnotationGUI(QMainWindow):
             )
         # Add more shortcuts as needed
 
+    def closeEvent(self, event):
+        self.stop_indexer()
+        super().closeEvent(event)
+
 
 def run_gui(video_list: List[str], skeleton_config: Dict):
     app = QApplication(sys.argv)
@@ -0,0 +1,232 @@
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+import toml
+
+# Store one thumbnail every THUMBNAIL_STRIDE frames
+THUMBNAIL_STRIDE = 25
+# Thumbnail size as (width, height), matching the 4:3 display aspect
+THUMBNAIL_SIZE = (80, 60)
+# Bump when the on-disk layout changes so old caches are rebuilt
+CACHE_VERSION = 1
+
+
+class ThumbnailIndex:
+    """
+    Memory-mapped thumbnails and per-frame activity scores for one video.
+
+    Attributes:
+    thumbnails (np.ndarray): uint8 array of shape (n_thumbnails, height, width, 3), RGB
+    activity (np.ndarray): float32 array of shape (frame_count,)
+    stride (int): Number of frames between consecutive thumbnails
+    frame_count (int): Number of frames read while indexing
+    """
+
+    def __init__(
+        self,
+        thumbnails: np.ndarray,
+        activity: np.ndarray,
+        stride: int,
+        frame_count: int,
+    ):
+        self.thumbnails = thumbnails
+        self.activity = activity
+        self.stride = stride
+        self.frame_count = frame_count
+
+    def thumbnail_for_frame(self, frame: int) -> np.ndarray:
+        """Return the cached thumbnail closest to (at or before) the given frame."""
+        index = min(max(frame, 0) // self.stride, len(self.thumbnails) - 1)
+        return self.thumbnails[index]
+
+
+def get_cache_paths(video_path: str) -> Tuple[str, str, str]:
+    """
+    Get the cache file paths for a video.
+
+    Args:
+    video_path (str): Path to the video file
+
+    Returns:
+    Tuple[str, str, str]: Paths of the thumbnails, activity and metadata files
+    """
+    base = os.path.splitext(video_path)[0]
+    return (
+        f"{base}_thumbnails.npy",
+        f"{base}_activity.npy",
+        f"{base}_thumbnails.toml",
+    )
+
+
+def _video_signature(video_path: str) -> Dict:
+    stat = os.stat(video_path)
+    return {"video_size": stat.st_size, "video_mtime": stat.st_mtime}
+
+
+def load_thumbnail_index(
+    video_path: str,
+    stride: int = THUMBNAIL_STRIDE,
+    thumb_size: Tuple[int, int] = THUMBNAIL_SIZE,
+) -> Optional[ThumbnailIndex]:
+    """
+    Load a previously built thumbnail index.
+
+    Args:
+    video_path (str): Path to the video file
+    stride (int): Expected number of frames between thumbnails
+    thumb_size (Tuple[int, int]): Expected thumbnail size as (width, height)
+
+    Returns:
+    Optional[ThumbnailIndex]: The cached index, or None if it is missing,
+        incomplete or out of date with respect to the video
+    """
+    thumbs_path, activity_path, meta_path = get_cache_paths(video_path)
+    if not all(os.path.exists(p) for p in (thumbs_path, activity_path, meta_path)):
+        return None
+
+    try:
+        with open(meta_path, "r") as meta_file:
+            meta = toml.load(meta_file)
+    except (OSError, toml.TomlDecodeError):
+        return None
+
+    expected = {
+        "version": CACHE_VERSION,
+        "stride": stride,
+        "thumb_width": thumb_size[0],
+        "thumb_height": thumb_size[1],
+        **_video_signature(video_path),
+    }
+    if any(meta.get(key) != value for key, value in expected.items()):
+        return None
+
+    frame_count = meta.get("frame_count", 0)
+    if frame_count <= 0:
+        return None
+    n_thumbnails = (frame_count + stride - 1) // stride
+
+    try:
+        thumbnails = np.load(thumbs_path, mmap_mode="r")
+        activity = np.load(activity_path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if thumbnails.shape[1:] != (thumb_size[1], thumb_size[0], 3):
+        return None
+    if len(thumbnails) < n_thumbnails or len(activity) < frame_count:
+        return None
+
+    return ThumbnailIndex(
+        thumbnails[:n_thumbnails], activity[:frame_count], stride, frame_count
+    )
+
+
+def build_thumbnail_index(
+    video_path: str,
+    stride: int = THUMBNAIL_STRIDE,
+    thumb_size: Tuple[int, int] = THUMBNAIL_SIZE,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Optional[ThumbnailIndex]:
+    """
+    Build the thumbnail index for a video in one sequential pass.
+
+    Every frame is downsampled to thumb_size; every stride-th one is stored
+    as a thumbnail, and the mean absolute difference between consecutive
+    grayscale thumbnails is stored as that frame's activity score.
+
+    Args:
+    video_path (str): Path to the video file
+    stride (int): Number of frames between thumbnails
+    thumb_size (Tuple[int, int]): Thumbnail size as (width, height)
+    progress_callback (Callable[[int, int], None]): Called with (frames_done, total_frames)
+    should_stop (Callable[[], bool]): Polled between frames; indexing is abandoned if it returns True
+
+    Returns:
+    Optional[ThumbnailIndex]: The new index, or None if the video could not
+        be read, the cache could not be written or indexing was stopped
+    """
+    cap = cv2.VideoCapture(video_path)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    if total_frames <= 0:
+        cap.release()
+        return None
+
+    thumbs_path, activity_path, meta_path = get_cache_paths(video_path)
+    width, height = thumb_size
+    n_thumbnails = (total_frames + stride - 1) // stride
+
+    try:
+        # Invalidate any previous cache before overwriting its data files
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        thumbnails = np.lib.format.open_memmap(
+            thumbs_path,
+            mode="w+",
+            dtype=np.uint8,
+            shape=(n_thumbnails, height, width, 3),
+        )
+        activity = np.lib.format.open_memmap(
+            activity_path, mode="w+", dtype=np.float32, shape=(total_frames,)
+        )
+
+        previous_gray = None
+        frame_count = 0
+        stopped = False
+        # CAP_PROP_FRAME_COUNT is an estimate; trust the frames actually decoded
+        while frame_count < total_frames:
+            if should_stop is not None and should_stop():
+                stopped = True
+                break
+
+            ret, frame = cap.read()
+            if not ret:
+                break
+
+            small = cv2.resize(frame, thumb_size, interpolation=cv2.INTER_AREA)
+            gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+            if previous_gray is None:
+                activity[frame_count] = 0.0
+            else:
+                activity[frame_count] = cv2.absdiff(gray, previous_gray).mean()
+            previous_gray = gray
+
+            if frame_count % stride == 0:
+                thumbnails[frame_count // stride] = cv2.cvtColor(
+                    small, cv2.COLOR_BGR2RGB
+                )
+
+            frame_count += 1
+            if progress_callback is not None and frame_count % stride == 0:
+                progress_callback(frame_count, total_frames)
+
+        thumbnails.flush()
+        activity.flush()
+        del thumbnails, activity
+
+        if stopped or frame_count == 0:
+            return None
+
+        # Metadata is written last so an interrupted build is never reused
+        meta = {
+            "version": CACHE_VERSION,
+            "stride": stride,
+            "thumb_width": width,
+            "thumb_height": height,
+            "frame_count": frame_count,
+            **_video_signature(video_path),
+        }
+        with open(meta_path, "w") as meta_file:
+            toml.dump(meta, meta_file)
+    except OSError:
+        # e.g. a read-only video directory or a full disk
+        return None
+    finally:
+        cap.release()
+
+    if progress_callback is not None:
+        progress_callback(frame_count, total_frames)
+
+    return load_thumbnail_index(video_path, stride, thumb_size)
@@ -0,0 +1,120 @@
+import unittest
+import tempfile
+import os
+import cv2
+import numpy as np
+from unittest import mock
+from fly_video_filtering.utils.thumbnails import (
+    build_thumbnail_index,
+    load_thumbnail_index,
+    get_cache_paths,
+)
+
+
+class TestThumbnailIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.video_path = os.path.join(self.temp_dir.name, "video.avi")
+
+        # Static frames with a bright square appearing at frame 30
+        writer = cv2.VideoWriter(
+            self.video_path, cv2.VideoWriter_fourcc(*"MJPG"), 25, (160, 120)
+        )
+        for i in range(60):
+            frame = np.zeros((120, 160, 3), dtype=np.uint8)
+            if i >= 30:
+                frame[40:80, 60:100] = 255
+            writer.write(frame)
+        writer.release()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_build_and_reload(self):
+        self.assertIsNone(load_thumbnail_index(self.video_path, stride=10))
+
+        index = build_thumbnail_index(self.video_path, stride=10)
+        self.assertIsNotNone(index)
+        self.assertEqual(index.frame_count, 60)
+        self.assertEqual(index.thumbnails.shape, (6, 60, 80, 3))
+        self.assertEqual(int(np.argmax(index.activity)), 30)
+
+        reloaded = load_thumbnail_index(self.video_path, stride=10)
+        self.assertIsNotNone(reloaded)
+        np.testing.assert_array_equal(reloaded.activity, index.activity)
+
+    def test_stale_cache_is_ignored(self):
+        build_thumbnail_index(self.video_path, stride=10)
+        self.assertIsNone(load_thumbnail_index(self.video_path, stride=5))
+
+        stat = os.stat(self.video_path)
+        os.utime(self.video_path, (stat.st_atime, stat.st_mtime + 10))
+        self.assertIsNone(load_thumbnail_index(self.video_path, stride=10))
+
+    def test_stopped_build_is_not_reused(self):
+        index = build_thumbnail_index(
+            self.video_path, stride=10, should_stop=lambda: True
+        )
+        self.assertIsNone(index)
+        self.assertFalse(os.path.exists(get_cache_paths(self.video_path)[2]))
+        self.assertIsNone(load_thumbnail_index(self.video_path, stride=10))
+
+    def test_corrupted_cache_is_ignored(self):
+        build_thumbnail_index(self.video_path, stride=10)
+        thumbs_path, activity_path, _ = get_cache_paths(self.video_path)
+
+        # Truncated array data
+        with open(thumbs_path, "r+b") as f:
+            f.truncate(os.path.getsize(thumbs_path) // 2)
+        self.assertIsNone(load_thumbnail_index(self.video_path, stride=10))
+
+        # Truncated header
+        with open(activity_path, "r+b") as f:
+            f.truncate(10)
+        self.assertIsNone(load_thumbnail_index(self.video_path, stride=10))
+
+    def test_frame_count_overestimated(self):
+        real_capture = cv2.VideoCapture
+
+        class OverestimatingCapture:
+            # Reports more frames than the file actually decodes
+            def __init__(self, path):
+                self.cap = real_capture(path)
+
+            def get(self, prop):
+                if prop == cv2.CAP_PROP_FRAME_COUNT:
+                    return self.cap.get(prop) + 25
+                return self.cap.get(prop)
+
+            def read(self):
+                return self.cap.read()
+
+            def release(self):
+                self.cap.release()
+
+        with mock.patch(
+            "fly_video_filtering.utils.thumbnails.cv2.VideoCapture",
+            OverestimatingCapture,
+        ):
+            index = build_thumbnail_index(self.video_path, stride=10)
+
+        self.assertIsNotNone(index)
+        self.assertEqual(index.frame_count, 60)
+        self.assertEqual(len(index.activity), 60)
+        self.assertEqual(len(index.thumbnails), 6)
+
+        reloaded = load_thumbnail_index(self.video_path, stride=10)
+        self.assertEqual(reloaded.frame_count, 60)
+        self.assertEqual(len(reloaded.activity), 60)
+        self.assertEqual(len(reloaded.thumbnails), 6)
+
+    def test_unwritable_cache_returns_none(self):
+        with mock.patch(
+            "fly_video_filtering.utils.thumbnails.np.lib.format.open_memmap",
+            side_effect=OSError("No space left on device"),
+        ):
+            self.assertIsNone(build_thumbnail_index(self.video_path, stride=10))
+
+
+if __name__ == "__main__":
+    unittest.main()